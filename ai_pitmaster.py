@@ -8,6 +8,8 @@ AI Pitmaster:
 """
 
 import json
+import re
+import selectors
 import sys
 import os
 import tempfile
@@ -19,19 +21,109 @@ import glob
 import shutil
 from datetime import datetime, timedelta
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-import anthropic
+# anthropic and requests are imported lazily (in __init__/send_sms): each
+# drags in a large dependency tree and together they push cold startup
+# past a second on a Pi, delaying the interactive setup prompts.
 
 # ----- optional SciPy/NumPy for curve fitting -------------------------------
 try:
     import numpy as np
-    from scipy.optimize import curve_fit          # needs scipy >= 1.9
 except ModuleNotFoundError:
     np = None
-    curve_fit = None
+
+curve_fit = None              # resolved lazily by _get_curve_fit()
+_curve_fit_unavailable = False
+
+
+def _get_curve_fit():
+    """Import scipy's curve_fit on first use.
+
+    The module-global `curve_fit` doubles as the cache and as an override
+    point (tests monkeypatch it directly). Returns None when SciPy is
+    missing, mirroring the old eager-import behavior.
+    """
+    global curve_fit, _curve_fit_unavailable
+    if curve_fit is None and not _curve_fit_unavailable:
+        try:
+            from scipy.optimize import curve_fit as _cf   # needs scipy >= 1.9
+            curve_fit = _cf
+        except ModuleNotFoundError:
+            _curve_fit_unavailable = True
+    return curve_fit
+
+
+try:
+    # numba validates its numpy/scipy versions at import time, so any
+    # failure here (not just a missing package) means no JIT.
+    from numba import njit                        # optional: JITs the 5PL kernel
+except Exception:
+    njit = None
 # ----------------------------------------------------------------------------
 
+
+def _logistic5_kernel(t, K, k, lam, D, gamma):
+    """5PL evaluated elementwise over a float64 time array.
+
+    Written as an explicit loop with the numerically-stable softplus
+    (see ClaudeBBQConversation._logistic5) so Numba can compile it to a
+    single vectorizable kernel. curve_fit calls this hundreds of times
+    per fit, so the JIT pays for itself within one cook.
+    """
+    out = np.empty(t.shape[0])
+    for i in range(t.shape[0]):
+        z = -k * (t[i] - lam)
+        if z > 0.0:
+            log1pexp = z + math.log1p(math.exp(-z))
+        else:
+            log1pexp = math.log1p(math.exp(z))
+        out[i] = D + (K - D) * math.exp(-gamma * log1pexp)
+    return out
+
+
+def _logistic5_vec(t, K, k, lam, D, gamma):
+    """Vectorized NumPy 5PL, used when Numba isn't installed."""
+    z = -k * (t - lam)
+    with np.errstate(over='ignore'):
+        return D + (K - D) * np.exp(-gamma * np.logaddexp(0.0, z))
+
+
+if njit is not None and np is not None:
+    logistic5 = njit(cache=True, fastmath=True)(_logistic5_kernel)
+else:
+    logistic5 = _logistic5_vec
+
+
+def logistic5_jac(t, K, k, lam, D, gamma):
+    """Analytic Jacobian of the 5PL, shape (N, 5) in (K, k, lam, D, gamma) order.
+
+    With u = 1 + exp(-k(t-lam)) and v = u**-gamma:
+        df/dK = v                   df/dD     = 1 - v
+        df/dk = (K-D)*gamma*v*(t-lam)*(u-1)/u
+        df/dlam = -(K-D)*gamma*v*k*(u-1)/u
+        df/dgamma = -(K-D)*v*ln(u)
+    Saves curve_fit the 5 extra residual evaluations per LM step it would
+    spend on finite differences. Everything goes through the softplus
+    ln(u) = logaddexp(0, z) so extreme probe parameters stay finite.
+    """
+    z = -k * (t - lam)
+    with np.errstate(over='ignore'):
+        log_u = np.logaddexp(0.0, z)       # ln(1 + e^z)
+        v = np.exp(-gamma * log_u)         # u**-gamma
+        sig = np.exp(z - log_u)            # (u-1)/u, i.e. sigmoid(z)
+    span = K - D
+    d_K = v
+    d_k = span * gamma * v * (t - lam) * sig
+    d_lam = -span * gamma * v * k * sig
+    d_D = 1.0 - v
+    d_gamma = -span * v * log_u
+    return np.column_stack((d_K, d_k, d_lam, d_D, d_gamma))
+
+# Sent as a cache_control-marked system block. Anthropic only caches prefixes
+# of at least 1024 tokens on Sonnet-class models, so this text must stay
+# comfortably above that (~4 chars/token -> keep it well over ~4100 chars) or
+# the cache marker silently does nothing and every turn re-bills the full text.
 PITMASTER_WISDOM = """
 Key BBQ knowledge:
 - Target pit temp: 225-235°F for low and slow. Can go up to 275°F for quicker cooks (e.g., pulled pork for timing), but risk of dryness increases. Turkey often done at 275-325°F for crispy skin.
@@ -52,6 +144,23 @@ Key BBQ knowledge:
 - Pork Shoulder can take ~1.5-2 h/lb.
 - Pork Ribs can take 5-6 hours using 3-2-1 method (unwrapped 3h, wrapped 2h, sauce 1h) or longer for "low and slow".
 - Turkey can take ~30-40 min/lb at 225-250°F (~4-6 hours for 12-14 lb bird), or 15-20 min/lb at 325°F. Spatchcocked turkey cooks faster.
+- Fire management: control pit temp with the intake (bottom) vents; leave the exhaust (top) vent at least 1/4 open so smoke never stagnates. Adjust in small increments and wait 10-15 minutes before adjusting again – chasing the needle causes oscillation.
+- Aim for thin blue smoke, not thick white billows. White smoke means smoldering, oxygen-starved fuel and deposits creosote (bitter, acrid flavor). If smoke turns white, open vents to get the fire burning clean before worrying about temperature.
+- Add wood chunks to hot coals gradually, not all at once. Most smoke flavor is absorbed in the first few hours while the meat surface is cold and wet; adding wood late in the cook does little.
+- Wood pairings: oak and hickory are all-purpose for beef and pork; pecan is milder and slightly sweet; fruit woods (apple, cherry) suit pork, ribs and poultry; mesquite is strong and best for short, hot cooks. Never use softwoods (pine, fir) – the resin is unpleasant and can be harmful.
+- Minion method: fill the charcoal basket with unlit briquettes and pour a small chimney of lit coals on top; the fire burns slowly outward for 8-12+ hours of steady heat. The snake/fuse method (a 2x2 line of briquettes around the ring, lit at one end) works similarly in kettle grills.
+- A water pan between fire and meat stabilizes pit temp (water buffers swings near 212°F), adds humidity that helps smoke adhere, and catches drippings. Refill with hot water so you don't crash the pit.
+- Probe placement matters: the meat probe belongs in the thickest part of the flat (brisket) or the center of the money muscle, away from bone, fat pockets and the surface. The pit probe should sit at grate level a few inches from the meat – dome thermometers can read 25°F+ off from where the meat actually sits.
+- Cold meat near the probe depresses pit readings early in the cook; don't chase that dip with more fuel or the pit will overshoot once the meat warms.
+- Weather: wind is the biggest enemy of a steady pit – it both fans the fire and strips heat from thin-walled smokers. Cold or rain raises fuel consumption; expect to add fuel more often and consider a windbreak. Avoid opening the lid in bad weather; every peek costs 15-30 minutes of recovery.
+- "If you're lookin', you ain't cookin'": keep the lid closed. Open only to wrap, spritz, or verify doneness.
+- Spritzing (apple juice, cider vinegar, or water) every 45-60 min after the bark starts to set keeps the surface moist and attracts smoke, but cools the pit and slows bark development – skip it if the bark looks right.
+- Bark forms when surface moisture evaporates and rub proteins/sugars polymerize. High humidity, heavy spritzing, and early wrapping all soften bark; if bark isn't set when the stall hits, ride the stall unwrapped a while longer.
+- Basic rub ratio: roughly equal parts kosher salt and coarse black pepper for Texas-style beef; add paprika, garlic, onion and a little sugar for pork. Go light on sugar above 275°F – it burns.
+- Food safety: keep raw meat out of the 40-140°F danger zone for more than 4 cumulative hours; intact muscle cuts are safe once the surface is seared/smoked, but injected or ground meat needs full internal pasteurization. Never rest meat below 140°F for extended periods without refrigerating.
+- Resting is not optional for big cuts: rest brisket and pork shoulder a minimum of 30-60 minutes, ideally 1-4 hours wrapped in towels in a dry cooler ("faux cambro"). Meat held this way stays above 140°F for hours, juices redistribute, and the texture improves markedly.
+- Carryover: internal temp keeps climbing 5-10°F after the meat comes off, more for larger cuts and hotter pits. Pull a few degrees shy of target if serving promptly.
+- Plan for the cook to run long: meat is done when it probes tender, not when the clock says so. Finishing 2 hours early is a faux cambro problem (easy); finishing 2 hours late is a hungry-guests problem (hard).
 - Smoking meat has three stages:
    Stage I (pre‑stall): Rapid temp rise, logistic growth.
    Stage II (stall): Temperature plateaus, linear or slow rise.
@@ -60,14 +169,121 @@ Key BBQ knowledge:
    Note: Turkey typically doesn't exhibit significant stall behavior like pork/brisket.
 """
 
+# Pulls the model name out of an rtl_433 JSON line without a full parse;
+# used only for lines that fail the cheap known-model prefilter.
+_MODEL_RE = re.compile(rb'"model"\s*:\s*"([^"]+)"')
+
+# Words suggesting the user just dealt with the fire. Matched once per
+# message when it's recorded, instead of rescanning a keyword list on
+# every proactive check. Inflections ("coals", "briquettes", "adding",
+# "refueled") must match too -- the boundaries only exist to stop
+# substring hits like 'add' inside 'addled'.
+FUEL_RE = re.compile(
+    r'\b(re)?(fuel\w*|coals?|woods?|woodchips?|charcoal|briquettes?'
+    r'|add(?:ed|ing)?|fires?)\b')
+
+
+# One multiply-add per reading on the hottest path (three conversions per
+# rtl_433 packet), instead of the two-step 9/5-then-add dance.
+_C_TO_F = 1.8
+
+
+def _parse_rtl433_time(s):
+    """Parse rtl_433's fixed 'YYYY-MM-DD HH:MM:SS' stamp by slicing.
+
+    strptime drags through locale-aware format machinery (tens of µs per
+    call) and this runs on every sensor packet. Raises ValueError on a
+    malformed stamp, same as strptime, so the reader's skip logic holds.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+# ============================ Temperature history ===========================
+
+class TempHistory(deque):
+    """Deque of {'time', 'pit', 'meat'} readings with SoA ring buffers.
+
+    The deque keeps every reading as a dict for session persistence and
+    display, exactly as before. Alongside it, append() mirrors the newest
+    RING_SLOTS readings into three parallel NumPy arrays (epoch seconds,
+    pit °F, meat °F) so the analytic hot paths (stall detection, trend
+    checks, curve fitting) can slice contiguous arrays instead of
+    rebuilding Python lists of dicts on every sample.
+
+    Only append() and clear() keep the ring in sync; the analytics never
+    use the other deque mutators, so they are left alone.
+    """
+
+    RING_SLOTS = 720  # ~2.4 h of TP12 readings at ~12 s cadence
+
+    def __init__(self, iterable=()):
+        super().__init__()
+        self._ring_reset()
+        for d in iterable:
+            self.append(d)
+
+    def _ring_reset(self):
+        if np is not None:
+            self._buf_time = np.empty(self.RING_SLOTS, np.float64)
+            self._buf_pit  = np.empty(self.RING_SLOTS, np.float32)
+            self._buf_meat = np.empty(self.RING_SLOTS, np.float32)
+        self._head = 0
+        self._ring_count = 0
+
+    def append(self, d):
+        super().append(d)
+        if np is None:
+            return
+        slot = self._head
+        self._buf_time[slot] = d['time'].timestamp()
+        self._buf_pit[slot]  = d['pit']
+        self._buf_meat[slot] = d['meat']
+        self._head = (slot + 1) % self.RING_SLOTS
+        self._ring_count = min(self._ring_count + 1, self.RING_SLOTS)
+
+    def clear(self):
+        super().clear()
+        self._ring_reset()
+
+    def recent(self, n=None):
+        """(times_s, pit, meat) for the newest n readings, oldest first.
+
+        Returns NumPy arrays (views when the ring hasn't wrapped) or,
+        without NumPy, plain lists built from the deque so callers that
+        only index endpoints work either way. None if no readings yet.
+        """
+        if len(self) == 0:
+            return None
+        if np is None:
+            items = list(self) if n is None else list(self)[-n:]
+            return ([d['time'].timestamp() for d in items],
+                    [d['pit'] for d in items],
+                    [d['meat'] for d in items])
+        count = self._ring_count if n is None else min(n, self._ring_count)
+        end = self._head
+        start = (end - count) % self.RING_SLOTS
+        if start < end:
+            sl = slice(start, end)
+            return (self._buf_time[sl], self._buf_pit[sl], self._buf_meat[sl])
+        return (np.concatenate((self._buf_time[start:], self._buf_time[:end])),
+                np.concatenate((self._buf_pit[start:],  self._buf_pit[:end])),
+                np.concatenate((self._buf_meat[start:], self._buf_meat[:end])))
+
+
 # ============================ Conversation Class ============================
 
 class ClaudeBBQConversation:
+    # Refit the Stage I model every Nth sensor sample (~5 min at 30 s cadence)
+    FIT_EVERY_N_SAMPLES = 10
+
     def __init__(self, api_key, target_pit=225, target_meat=203,
                  meat_type="brisket", weight=12, phone=None,
                  session_file=".bbq_session.json"):
 
+        import anthropic  # deferred so `python3 ai_pitmaster.py` prompts fast
+
         self.client       = anthropic.Anthropic(api_key=api_key)
+        self._http        = None  # TextBelt session, created on first SMS
         self.target_pit   = target_pit
         self.target_meat  = target_meat
         self.meat_type    = meat_type
@@ -78,7 +294,15 @@ class ClaudeBBQConversation:
         # conversation & telemetry state
         self.messages      = []
         self.data_queue    = queue.Queue()
-        self.temp_history  = deque()  # keep all temp readings for complete cook history
+        self._wake_w       = None  # self-pipe write end, set by run()
+
+        # Claude calls run on a single worker so the event loop never blocks
+        # on the API round-trip; the lock serializes message-list mutation.
+        self._claude_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='claude')
+        self._messages_lock = threading.Lock()
+        self._save_requested = False  # set by worker threads, served by run()
+        self.temp_history  = TempHistory()  # keep all temp readings for complete cook history
         self.start_time    = datetime.now()
         self.last_update   = None
         self.ambient_temp  = None
@@ -104,6 +328,10 @@ class ClaudeBBQConversation:
         self.last_save_time = None
         self.save_interval = int(os.getenv("BBQ_SAVE_INTERVAL", "60"))  # seconds between auto-saves
 
+        # Upper bound on the prompt sent per API call (approx tokens); keeps
+        # latency/cost bounded even if the user pastes logs into the chat
+        self.prompt_token_budget = int(os.getenv("BBQ_PROMPT_TOKEN_BUDGET", "4000"))
+
         # rtl_433 device-model configuration (comma-separated env vars override defaults)
         self.thermometer_models = [
             m.strip() for m in os.getenv("BBQ_THERMOMETER_MODEL", "Thermopro-TP12").split(",")
@@ -125,13 +353,23 @@ class ClaudeBBQConversation:
         self.eta_wrap      = None
         self.eta_finish    = None
         self.model_rmse    = None
+        self._last_rmse_popt = None     # params the cached RMSE was computed with
+        self._last_eta_key = None       # rounded params the ETAs were solved for
+        self._fit_counter  = 0          # samples seen since the cook started
         # ----------------------------------------------------------
 
+        # Static BBQ knowledge goes in the system prompt with an ephemeral
+        # cache_control marker so Anthropic caches the prefix across turns
+        # instead of re-billing/re-tokenizing it on every call.
+        self.system_blocks = [{
+            "type": "text",
+            "text": PITMASTER_WISDOM,
+            "cache_control": {"type": "ephemeral"},
+        }]
+
         init_msg = f"""You're helping me smoke a {weight} lb {meat_type}.
 Target pit: {target_pit} °F. Target meat: {target_meat} °F.
 
-{PITMASTER_WISDOM}
-
 I'll feed you temp updates and notes.  Reply with brief, specific, casual advice.
 
 Starting the cook now."""
@@ -143,7 +381,14 @@ Starting the cook now."""
     # --------------------------------------------------------------------- #
 
     def save_session(self):
-        """Save current session state to disk."""
+        """Save current session state to disk.
+
+        Runs on the main thread only; worker threads request a save via
+        _request_save(). messages is still snapshotted under the lock because
+        the claude worker appends to it mid-call.
+        """
+        with self._messages_lock:
+            messages = list(self.messages)
         session_data = {
             'metadata': {
                 'meat_type': self.meat_type,
@@ -154,7 +399,7 @@ Starting the cook now."""
             'start_time': self.start_time.isoformat(),
             'last_update': self.last_update.isoformat() if self.last_update else None,
             'ambient_temp': self.ambient_temp,
-            'messages': self.messages,  # save all messages for complete history
+            'messages': messages,  # save all messages for complete history
             'temp_history': [
                 {
                     'time': d['time'].isoformat(),
@@ -171,7 +416,8 @@ Starting the cook now."""
                 {
                     'time': a['time'].isoformat(),
                     'message': a['message'],
-                    'input': a['input']
+                    'input': a['input'],
+                    'has_fuel': a.get('has_fuel')
                 }
                 for a in list(self.recent_user_actions)
             ],
@@ -215,8 +461,11 @@ Starting the cook now."""
                 data = json.load(f)
 
             # Create instance without calling initial Claude conversation
+            import anthropic
+
             instance = cls.__new__(cls)
             instance.client = anthropic.Anthropic(api_key=api_key)
+            instance._http = None
             instance.session_file = session_file
             instance.phone = phone
 
@@ -234,15 +483,13 @@ Starting the cook now."""
             instance.messages = data['messages']
 
             # Restore temperature history
-            instance.temp_history = deque(
-                [
-                    {
-                        'time': datetime.fromisoformat(d['time']),
-                        'pit': d['pit'],
-                        'meat': d['meat']
-                    }
-                    for d in data['temp_history']
-                ],
+            instance.temp_history = TempHistory(
+                {
+                    'time': datetime.fromisoformat(d['time']),
+                    'pit': d['pit'],
+                    'meat': d['meat']
+                }
+                for d in data['temp_history']
             )
 
             # Restore alert states
@@ -257,7 +504,8 @@ Starting the cook now."""
                     {
                         'time': datetime.fromisoformat(a['time']),
                         'message': a['message'],
-                        'input': a['input']
+                        'input': a['input'],
+                        'has_fuel': a.get('has_fuel')
                     }
                     for a in data['recent_user_actions']
                 ],
@@ -273,15 +521,31 @@ Starting the cook now."""
             instance.eta_wrap = data['eta_wrap']
             instance.eta_finish = data['eta_finish']
             instance.model_rmse = data['model_rmse']
+            instance._last_rmse_popt = None
+            instance._last_eta_key = None
+            instance._fit_counter = 0
+
+            # Cached system prompt is static; rebuild rather than persist it.
+            instance.system_blocks = [{
+                "type": "text",
+                "text": PITMASTER_WISDOM,
+                "cache_control": {"type": "ephemeral"},
+            }]
 
             # Restore config values from env
             instance.sms_cooldown = int(os.getenv("BBQ_SMS_COOLDOWN", "900"))
             instance.display_interval = int(os.getenv("BBQ_DISPLAY_INTERVAL", "120"))
             instance.proactive_check_interval = int(os.getenv("BBQ_PROACTIVE_INTERVAL", "300"))
             instance.save_interval = int(os.getenv("BBQ_SAVE_INTERVAL", "60"))
+            instance.prompt_token_budget = int(os.getenv("BBQ_PROMPT_TOKEN_BUDGET", "4000"))
 
             # Non-persistent state
             instance.data_queue = queue.Queue()
+            instance._wake_w = None
+            instance._claude_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='claude')
+            instance._messages_lock = threading.Lock()
+            instance._save_requested = False
             instance.last_save_time = datetime.now()  # reset save timer
 
             cook_hours = (datetime.now() - instance.start_time).total_seconds() / 3600
@@ -303,11 +567,16 @@ Starting the cook now."""
             return  # still in cooldown
 
         try:
-            resp = requests.post('https://textbelt.com/text', {
+            # Pooled session skips the TLS handshake on repeat alerts; the
+            # timeout keeps a slow TextBelt from wedging the event loop.
+            if self._http is None:
+                import requests  # deferred until the first SMS actually fires
+                self._http = requests.Session()
+            resp = self._http.post('https://textbelt.com/text', {
                 'phone': self.phone,
                 'message': f"BBQ: {message}",
                 'key': os.getenv('TXTBELT_KEY', 'textbelt')
-            }).json()
+            }, timeout=5).json()
             if resp.get('success'):
                 self.last_sms_time[alert_type] = datetime.now()
                 print(f"\n📱 SMS sent: {message}")
@@ -346,21 +615,52 @@ Starting the cook now."""
             self.messages = [initial_msg, summary_msg] + recent_messages
             print(f"📝 Summarized conversation history (~{estimated_tokens} tokens)")
 
-    def _ask_claude(self, user_msg=None):
-        if user_msg:
-            self.messages.append({"role": "user", "content": user_msg})
+    def _build_request_messages(self):
+        """Trim the prompt for one API call to the token budget.
 
-        self._summarize_old_messages()
+        Keeps the initial cook-context message, then takes as many of the
+        newest messages as fit (walking back-to-front); the newest message
+        is always included even if it alone blows the budget. The full
+        history in self.messages is untouched -- this only shapes what a
+        single request sends, so a pasted log can't balloon latency/cost.
+        """
+        if len(self.messages) <= 2:
+            return list(self.messages)
+
+        initial = self.messages[0]
+        budget = self.prompt_token_budget
+        budget -= max(1, len(str(initial.get('content', ''))) // 4)
+
+        picked = []
+        for msg in reversed(self.messages[1:]):
+            cost = max(1, len(str(msg.get('content', ''))) // 4)
+            if picked and cost > budget:
+                break
+            budget -= cost
+            picked.append(msg)
+        picked.reverse()
+        return [initial] + picked
+
+    def _ask_claude(self, user_msg=None):
+        # May run on the claude worker thread, so message-list mutation is
+        # serialized against the main thread (and future callers).
+        with self._messages_lock:
+            if user_msg:
+                self.messages.append({"role": "user", "content": user_msg})
+            self._summarize_old_messages()
+            request_messages = self._build_request_messages()
 
         try:
             response = self.client.messages.create(
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=300,
                 temperature=0.2,
-                messages=self.messages
+                system=self.system_blocks,
+                messages=request_messages
             )
             content = response.content[0].text
-            self.messages.append({"role": "assistant", "content": content})
+            with self._messages_lock:
+                self.messages.append({"role": "assistant", "content": content})
             return content
         except Exception as e:
             return f"claude broke: {e}"
@@ -389,7 +689,7 @@ Starting the cook now."""
             self.alert_states['pit_spike'] = False
 
         if 148 < meat < 152 and len(self.temp_history) > 10:
-            recent_meat = [d['meat'] for d in list(self.temp_history)[-10:]]
+            _, _, recent_meat = self.temp_history.recent(10)
             if max(recent_meat) - min(recent_meat) < 3:
                 if not self.alert_states['stall_approaching']:
                     self.alert_states['stall_approaching'] = True
@@ -409,14 +709,17 @@ Starting the cook now."""
         if len(self.temp_history) < 20:
             return
             
-        recent = list(self.temp_history)[-20:]  # last ~10 minutes of data
-        pit_temps = [d['pit'] for d in recent]
+        _, pit_temps, _ = self.temp_history.recent(20)  # last ~10 minutes of data
         now = datetime.now()
-        
+
         # Check for sustained pit temp decline
         if len(pit_temps) >= 10:
-            early_avg = sum(pit_temps[:5]) / 5
-            late_avg = sum(pit_temps[-5:]) / 5
+            if np is not None:
+                early_avg = float(pit_temps[:5].mean())
+                late_avg = float(pit_temps[-5:].mean())
+            else:
+                early_avg = sum(pit_temps[:5]) / 5
+                late_avg = sum(pit_temps[-5:]) / 5
             decline = early_avg - late_avg
             
             # Check if temperature is recovering after fuel addition
@@ -448,8 +751,10 @@ Starting the cook now."""
         for action in list(self.recent_user_actions)[-5:]:  # last 5 messages
             time_diff = (now - action['time']).total_seconds() / 60
             if time_diff < 20:  # within 20 minutes
-                fuel_keywords = ['fuel', 'coal', 'wood', 'charcoal', 'briquette', 'added', 'add', 'fire']
-                if any(keyword in action['message'] for keyword in fuel_keywords):
+                has_fuel = action.get('has_fuel')
+                if has_fuel is None:  # action restored from an older session file
+                    has_fuel = FUEL_RE.search(action['message']) is not None
+                if has_fuel:
                     recent_fuel_discussion = True
                     break
         
@@ -471,16 +776,14 @@ Starting the cook now."""
         if len(self.temp_history) < 10:
             return False
 
-        recent = list(self.temp_history)[-10:]
-        times_s = [(d['time'] - recent[0]['time']).total_seconds() for d in recent]
-        temps_f = [d['meat'] for d in recent]
+        times_s, _, temps_f = self.temp_history.recent(10)
 
         if len(set(times_s)) < 3:
             return False  # timestamps not distinct
 
         # centred 3‑point finite diff on last 3 samples
-        t1, t0, tm1 = times_s[-1], times_s[-2], times_s[-3]
-        f1, f0, fm1 = temps_f[-1], temps_f[-2], temps_f[-3]
+        t1, tm1 = float(times_s[-1]), float(times_s[-3])
+        f1, f0, fm1 = float(temps_f[-1]), float(temps_f[-2]), float(temps_f[-3])
 
         dt_hours = (t1 - tm1) / 3600.0
         if dt_hours == 0:
@@ -516,65 +819,117 @@ Starting the cook now."""
         log1pexp = z + math.log1p(math.exp(-z)) if z > 0 else math.log1p(math.exp(z))
         return D + (K - D) * math.exp(-gamma * log1pexp)
 
+    @staticmethod
+    def _invert_logistic5(T, K, k, lam, D, gamma):
+        """Hours on the model clock at which the fitted 5PL crosses T.
+
+        Returns None when T lies outside the curve's (D, K) range or the
+        inversion degenerates (e.g. the pow/log going complex for a
+        pathological gamma), instead of letting the exception discard the
+        rest of the fit results.
+        """
+        if not (D < T < K):
+            return None
+        ratio = (K - D) / (T - D)
+        try:
+            return lam - (1 / k) * math.log(ratio ** (1 / gamma) - 1)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return None
+
     def _update_model_estimate(self):
         """Fit Stage I logistic curve and compute ETA."""
-        if curve_fit is None:
-            return  # SciPy not available
+        cf = _get_curve_fit()
+        if cf is None or np is None:
+            return  # SciPy/NumPy not available
 
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        stage1_pts = [(d['time'], d['meat'])
-                      for d in self.temp_history
-                      if d['time'] >= one_hour_ago and d['meat'] <= 150]
+        # Stage I is over once the meat is past the stall band -- the
+        # logistic growth model no longer applies, so stop fitting.
+        if self.temp_history and self.temp_history[-1]['meat'] > 170:
+            return
 
-        if len(stage1_pts) < 15:
+        # A single new ~30 s sample barely moves the parameters; running
+        # the nonlinear solve on every reading just burns CPU and makes
+        # the displayed ETAs jitter. Refit every 10th sample (~5 min).
+        counter = self._fit_counter
+        self._fit_counter += 1
+        if counter % self.FIT_EVERY_N_SAMPLES != 0:
             return
 
-        t0 = stage1_pts[0][0]
-        t_hours = [(pt[0] - t0).total_seconds() / 3600 for pt in stage1_pts]
-        temps   = [pt[1] for pt in stage1_pts]
+        # Stage I window: last hour of pre-stall readings, selected with a
+        # boolean mask on the epoch-seconds ring instead of a Python pass
+        # over datetime dicts.
+        hist = self.temp_history.recent()
+        if hist is None:
+            return
+        times_s, _, meat_f = hist
+        cutoff = datetime.now().timestamp() - 3600.0
+        mask = (times_s >= cutoff) & (meat_f <= 150)
 
-        D_init   = temps[0]
-        K_init   = self.target_meat
-        k_init   = 1.0
-        lam_init = t_hours[len(t_hours)//2]
-        gamma_init = 1.0
+        sel_t = times_s[mask]
+        if sel_t.size < 15:
+            return
+
+        t0_epoch = float(sel_t[0])
+        t0 = datetime.fromtimestamp(t0_epoch)
+        t_hours = (sel_t - t0_epoch) / 3600.0
+        temps = meat_f[mask].astype(np.float64)
+
+        if self.model_params is not None and len(self.model_params) == 5:
+            # Warm start from the previous fit: LM typically converges in
+            # 2-3 iterations instead of 10+ from the cold guesses.
+            p0 = [float(p) for p in self.model_params]
+        else:
+            D_init   = temps[0]
+            K_init   = self.target_meat
+            k_init   = 1.0
+            lam_init = t_hours[len(t_hours)//2]
+            gamma_init = 1.0
+            p0 = [K_init, k_init, lam_init, D_init, gamma_init]
 
         try:
-            popt, _ = curve_fit(
-                self._logistic5, t_hours, temps,
-                p0=[K_init, k_init, lam_init, D_init, gamma_init],
+            popt, _ = cf(
+                logistic5, t_hours, temps,
+                p0=p0,
+                jac=logistic5_jac,
+                check_finite=False,   # inputs are pre-filtered floats
+                xtol=1e-5,
                 maxfev=8000
             )
             self.model_params = popt
-            K, k, lam, D, gamma = popt
-
-            # inverse 5PL to solve for t when meat == wrap temperature (150 F)
-            wrap_T = 150.0
-            if D < wrap_T < K:
-                ratio_wrap = (K - D) / (wrap_T - D)
-                t_wrap = lam - (1/k) * math.log(ratio_wrap ** (1/gamma) - 1)
-                self.eta_wrap = self.start_time + timedelta(
-                    hours=t_wrap + (t0 - self.start_time).total_seconds()/3600)
-            else:
-                self.eta_wrap = None
-
-            # inverse 5PL to solve for t when meat == target_meat
-            target_T = self.target_meat
-            if target_T < K:
-                ratio = (K - D) / (target_T - D)
-                t_target = lam - (1/k) * math.log(ratio ** (1/gamma) - 1)
-                self.eta_finish = self.start_time + timedelta(
-                    hours=t_target + (t0 - self.start_time).total_seconds()/3600)
-            else:
-                self.eta_finish = None
 
-            # RMSE on full history
-            full_t = [(d['time'] - t0).total_seconds()/3600
-                      for d in self.temp_history]
-            preds  = [self._logistic5(ti, *popt) for ti in full_t]
-            full_y = [d['meat'] for d in self.temp_history]
-            mse = sum((y - p) ** 2 for y, p in zip(full_y, preds)) / len(full_y)
-            self.model_rmse = math.sqrt(mse)
+            # ETAs depend only on the fitted parameters, so when a refit
+            # lands where the last one did (common with warm starts during
+            # a steady climb) skip the log/pow inversions entirely. A t0
+            # shift with identical parameters can't happen: lam is measured
+            # from t0, so a moved window moves lam past the tolerance too.
+            eta_key = tuple(np.round(popt, 3))
+            if eta_key != self._last_eta_key:
+                self._last_eta_key = eta_key
+                t0_offset_hours = (t0 - self.start_time).total_seconds() / 3600
+
+                # inverse 5PL: when does the curve cross wrap (150 F) / target?
+                t_wrap = self._invert_logistic5(150.0, *popt)
+                self.eta_wrap = (
+                    self.start_time + timedelta(hours=t_wrap + t0_offset_hours)
+                    if t_wrap is not None else None)
+
+                t_target = self._invert_logistic5(float(self.target_meat), *popt)
+                self.eta_finish = (
+                    self.start_time + timedelta(hours=t_target + t0_offset_hours)
+                    if t_target is not None else None)
+
+            # RMSE over the ring buffer (the whole cook until it wraps).
+            # Skip the recompute when the fit barely moved -- the number
+            # shown to the user wouldn't change either.
+            if (self._last_rmse_popt is None or
+                    float(np.max(np.abs(popt - self._last_rmse_popt))) >= 1e-3):
+                times_all, _, meat_all = self.temp_history.recent()
+                t_all = np.ascontiguousarray(
+                    (times_all - t0_epoch) / 3600.0)
+                preds = logistic5(t_all, *popt)
+                resid = meat_all.astype(np.float64) - preds
+                self.model_rmse = float(np.sqrt(np.mean(resid ** 2)))
+                self._last_rmse_popt = popt.copy()
 
         except Exception:
             pass  # silently ignore fit failures
@@ -587,19 +942,17 @@ Starting the cook now."""
         if len(self.temp_history) < 2:
             return "no temp data yet"
 
-        recent = list(self.temp_history)[-20:]
-        pit_t   = [d['pit']  for d in recent]
-        meat_t  = [d['meat'] for d in recent]
+        times_s, pit_t, meat_t = self.temp_history.recent(20)
 
-        pit_now, meat_now = pit_t[-1], meat_t[-1]
+        pit_now, meat_now = float(pit_t[-1]), float(meat_t[-1])
 
         # Use the window's actual elapsed time so the rate is correct
         # regardless of the thermometer's broadcast interval (TP12: ~12 s).
-        window_seconds = (recent[-1]['time'] - recent[0]['time']).total_seconds()
+        window_seconds = float(times_s[-1] - times_s[0])
         if window_seconds > 0:
             window_hours = window_seconds / 3600.0
-            pit_rate  = (pit_t[-1]  - pit_t[0])  / window_hours
-            meat_rate = (meat_t[-1] - meat_t[0]) / window_hours
+            pit_rate  = float(pit_t[-1]  - pit_t[0])  / window_hours
+            meat_rate = float(meat_t[-1] - meat_t[0]) / window_hours
         else:
             pit_rate  = 0.0
             meat_rate = 0.0
@@ -619,26 +972,50 @@ Starting the cook now."""
         return summary
 
     def handle_user_input(self, user_input):
-        # Track user actions for context
+        # Track user actions for context; classify fuel talk once here so
+        # the proactive checks never rescan the text.
         now = datetime.now()
+        message = user_input.lower()
+        has_fuel = FUEL_RE.search(message) is not None
         self.recent_user_actions.append({
             'time': now,
-            'message': user_input.lower(),
-            'input': user_input
+            'message': message,
+            'input': user_input,
+            'has_fuel': has_fuel
         })
-        
+
         # Track fuel-related mentions
-        fuel_keywords = ['fuel', 'coal', 'wood', 'charcoal', 'briquette', 'added', 'add']
-        if any(keyword in user_input.lower() for keyword in fuel_keywords):
+        if has_fuel:
             self.last_fuel_mention = now
             self.temp_recovery_in_progress = True
         
         msg = f"{user_input}\n\nCurrent: {self.get_temp_summary()}"
         print()
-        print(f"\n🤖 {self._ask_claude(msg)}\n")
-
-        # Save session after user interaction (important state change)
-        self.save_session()
+        # Don't block the event loop on the multi-second API round-trip --
+        # temps keep flowing and critical-condition checks keep running
+        # while Claude thinks. The reply prints when it lands.
+        fut = self._claude_executor.submit(self._ask_claude, msg)
+        fut.add_done_callback(self._on_claude_reply)
+
+    def _on_claude_reply(self, future):
+        """Runs on the claude worker thread when a reply arrives."""
+        self._flush_progress_dots()
+        print(f"\n🤖 {future.result()}\n")
+
+        # Save session after user interaction (important state change).
+        # save_session reads temp_history and friends, which the main loop
+        # mutates, so hand the save back to run() instead of doing it here.
+        self._request_save()
+
+    def _request_save(self):
+        """Ask the main loop to save the session (safe from worker threads)."""
+        if self._wake_w is None:
+            # run() isn't active (startup, tests) -- no concurrent mutation
+            # possible, save directly.
+            self.save_session()
+            return
+        self._save_requested = True
+        self._notify_main_loop()
 
     # --------------------------------------------------------------------- #
     #                          Sensor / event loop                          #
@@ -657,27 +1034,38 @@ Starting the cook now."""
               f"(set BBQ_THERMOMETER_MODEL or BBQ_AMBIENT_MODEL to use it)")
 
     def temp_reader_thread(self):
+        # Bytes needles for the models we care about. In an RF-noisy
+        # neighborhood most rtl_433 lines are from unrelated devices, so a
+        # cheap substring check avoids json.loads on the vast majority.
+        wanted = [m.encode() for m in self.thermometer_models + self.ambient_models]
         try:
             proc = subprocess.Popen(
                 ["rtl_433", "-F", "json"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                universal_newlines=True
             )
             for line in proc.stdout:
+                if not any(n in line for n in wanted):
+                    # Still surface unrecognized hardware (rate-limited in
+                    # _log_unknown_model) without paying for a full parse.
+                    m = _MODEL_RE.search(line)
+                    if m:
+                        self._log_unknown_model(m.group(1).decode('utf-8', 'replace'))
+                    continue
                 try:
-                    data = json.loads(line.strip())
+                    data = json.loads(line)
                     model = data.get('model')
                     if model in self.thermometer_models:
                         parsed = {
-                            'time': datetime.strptime(data['time'], '%Y-%m-%d %H:%M:%S'),
-                            'pit':  data['temperature_1_C'] * 9/5 + 32,
-                            'meat': data['temperature_2_C'] * 9/5 + 32
+                            'time': _parse_rtl433_time(data['time']),
+                            'pit':  data['temperature_1_C'] * _C_TO_F + 32.0,
+                            'meat': data['temperature_2_C'] * _C_TO_F + 32.0
                         }
                         self.data_queue.put(parsed)
+                        self._notify_main_loop()
 
                     elif model in self.ambient_models:
-                        self.ambient_temp = data['temperature_C'] * 9/5 + 32
+                        self.ambient_temp = data['temperature_C'] * _C_TO_F + 32.0
                     elif model:
                         self._log_unknown_model(model)
                 except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
@@ -690,6 +1078,16 @@ Starting the cook now."""
         except Exception as e:
             print(f"rtl_433 died: {e}")
 
+    def _notify_main_loop(self):
+        """Wake run()'s selector after enqueuing a sample (self-pipe)."""
+        wake = self._wake_w
+        if wake is None:
+            return  # run() not started (e.g. unit tests drive the reader directly)
+        try:
+            os.write(wake, b'\x00')
+        except (BlockingIOError, OSError):
+            pass  # pipe full or shutting down -- the loop will catch up
+
     def _flush_progress_dots(self):
         """Terminate any in-progress dot row so the next line starts fresh."""
         if self.progress_dots_pending:
@@ -739,6 +1137,13 @@ Starting the cook now."""
             self.last_save_time = now
 
     def run(self):
+        # Self-pipe: the reader thread writes a byte per enqueued sample so
+        # this loop can block in select() instead of waking at 10 Hz to poll
+        # the queue. Matters on battery-powered Pi deployments.
+        wake_r, self._wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
         temp_thread = threading.Thread(target=self.temp_reader_thread, daemon=True)
         temp_thread.start()
 
@@ -748,32 +1153,67 @@ Starting the cook now."""
         print("  windy AF today")
         print("-" * 50)
 
-        while True:
-            while not self.data_queue.empty():
-                self.process_temp_update(self.data_queue.get())
+        sel = selectors.DefaultSelector()
+        sel.register(wake_r, selectors.EVENT_READ, 'wake')
+        try:
+            # stdin is POSIX-only here, same as the old select()-based loop
+            sel.register(sys.stdin, selectors.EVENT_READ, 'stdin')
+        except (ValueError, OSError):
+            pass  # stdin closed/unusable -- keep monitoring temps anyway
 
-            # non‑blocking stdin (POSIX only)
-            try:
-                import select
-                if sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
-                    user_input = input().strip()
-                    if user_input.lower() == 'quit':
-                        return
-                    if user_input:
-                        self.handle_user_input(user_input)
-            except Exception:
-                pass
-
-            if self.last_update and (datetime.now() - self.last_update).total_seconds() > 300:
-                now = datetime.now()
-                if (self.last_sensor_warning is None or
-                        (now - self.last_sensor_warning).total_seconds() >= self.sensor_warning_cooldown):
-                    self._flush_progress_dots()
-                    print("⚠️  No temp data for 5 min – check the sensor")
-                    self.last_sensor_warning = now
-                    if not self.alert_states.get('sensor_lost'):
-                        self.alert_states['sensor_lost'] = True
-                        self.send_sms("no temp data for 5 min - check the sensor", alert_type='sensor_lost')
+        try:
+            idle_iters = 0
+            while True:
+                # Adaptive backoff: stay snappy right after activity, then
+                # double the sleep toward 60 s while nothing is arriving --
+                # fewer wakeups/syscalls on long quiet stretches, with no
+                # user-visible latency since events still wake us instantly.
+                timeout = min(60.0, 0.1 * (1 << min(idle_iters, 10)))
+                events = sel.select(timeout=timeout)
+                idle_iters = 0 if events else idle_iters + 1
+                for key, _ in events:
+                    if key.data == 'wake':
+                        try:
+                            while os.read(wake_r, 4096):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        while not self.data_queue.empty():
+                            self.process_temp_update(self.data_queue.get())
+                    else:
+                        try:
+                            user_input = input().strip()
+                        except EOFError:
+                            # stdin went away (e.g. piped input ended); stop
+                            # watching it but keep the cook monitored.
+                            sel.unregister(sys.stdin)
+                            continue
+                        if user_input.lower() == 'quit':
+                            return
+                        if user_input:
+                            self.handle_user_input(user_input)
+
+                if self._save_requested:
+                    self._save_requested = False
+                    self.save_session()
+                    self.last_save_time = datetime.now()
+
+                if self.last_update and (datetime.now() - self.last_update).total_seconds() > 300:
+                    now = datetime.now()
+                    if (self.last_sensor_warning is None or
+                            (now - self.last_sensor_warning).total_seconds() >= self.sensor_warning_cooldown):
+                        self._flush_progress_dots()
+                        print("⚠️  No temp data for 5 min – check the sensor")
+                        self.last_sensor_warning = now
+                        if not self.alert_states.get('sensor_lost'):
+                            self.alert_states['sensor_lost'] = True
+                            self.send_sms("no temp data for 5 min - check the sensor", alert_type='sensor_lost')
+        finally:
+            sel.close()
+            wake_w, self._wake_w = self._wake_w, None
+            os.close(wake_w)
+            os.close(wake_r)
+            self._claude_executor.shutdown(wait=False)
 
 # ================================ Session Management =======================
 
@@ -45,6 +45,32 @@ def test_logistic5_numerically_stable_for_large_exp_argument():
     assert result == pytest.approx(40.0, abs=1e-9)
 
 
+def test_logistic5_jac_matches_finite_differences():
+    """The analytic Jacobian passed to curve_fit must agree with a central
+    finite-difference estimate of the 5PL partials, column order
+    (K, k, lam, D, gamma). A sign or ordering mistake here silently
+    degrades the fit rather than raising, so check it numerically."""
+    import numpy as np
+
+    t = np.linspace(0.0, 2.0, 25)
+    params = (203.0, 3.0, 0.5, 40.0, 1.3)
+
+    jac = ai_pitmaster.logistic5_jac(t, *params)
+    assert jac.shape == (25, 5)
+
+    eps = 1e-6
+    for col in range(5):
+        p_hi = list(params)
+        p_lo = list(params)
+        p_hi[col] += eps
+        p_lo[col] -= eps
+        fd = (ai_pitmaster._logistic5_vec(t, *p_hi) -
+              ai_pitmaster._logistic5_vec(t, *p_lo)) / (2 * eps)
+        assert np.allclose(jac[:, col], fd, atol=1e-5), (
+            f"Jacobian column {col} disagrees with finite differences"
+        )
+
+
 def test_detect_stall_mathematical():
     """Test the mathematical stall detection"""
     convo = ai_pitmaster.ClaudeBBQConversation(
@@ -330,6 +356,44 @@ def test_get_temp_summary_meat_rate_handles_30s_sampling():
     )
 
 
+def test_temp_history_ring_stays_in_sync_after_wraparound():
+    """TempHistory mirrors readings into fixed-size ring buffers while the
+    deque keeps the full history. After more than RING_SLOTS appends the
+    ring must wrap and recent() must still return the newest readings in
+    chronological order."""
+    hist = ai_pitmaster.TempHistory()
+    slots = ai_pitmaster.TempHistory.RING_SLOTS
+    base_time = datetime(2026, 1, 1, 6, 0, 0)
+
+    total = slots + 25
+    for i in range(total):
+        hist.append({
+            'time': base_time + timedelta(seconds=i * 12),
+            'pit': 225.0,
+            'meat': 100.0 + i * 0.1,
+        })
+
+    # Deque keeps everything; ring keeps the newest RING_SLOTS.
+    assert len(hist) == total
+
+    times_s, pit, meat = hist.recent(10)
+    assert len(times_s) == len(pit) == len(meat) == 10
+    # Oldest-first and contiguous with the last 10 appends.
+    expected_last = 100.0 + (total - 1) * 0.1
+    assert meat[-1] == pytest.approx(expected_last, abs=1e-3)
+    assert meat[0] == pytest.approx(expected_last - 0.9, abs=1e-3)
+    assert all(times_s[i] < times_s[i + 1] for i in range(9))
+
+    # A full-ring read must also be chronological across the wrap point.
+    times_all, _, meat_all = hist.recent()
+    assert len(times_all) == slots
+    assert all(times_all[i] < times_all[i + 1] for i in range(slots - 1))
+
+    hist.clear()
+    assert len(hist) == 0
+    assert hist.recent(10) is None
+
+
 def test_check_critical_conditions_pit_crash():
     """Test pit crash detection"""
     convo = ai_pitmaster.ClaudeBBQConversation(
@@ -490,13 +554,12 @@ def test_check_critical_conditions_meat_done():
     # Note: We're testing that the logic runs, not that TextBelt works
 
 
-@patch('requests.post')
-def test_send_sms(mock_post):
-    """Test SMS sending functionality"""
-    mock_response = Mock()
-    mock_response.json.return_value = {'success': True}
-    mock_post.return_value = mock_response
-    
+@patch('requests.Session')
+def test_send_sms(mock_session_cls):
+    """Test SMS sending via the pooled HTTP session"""
+    mock_post = mock_session_cls.return_value.post
+    mock_post.return_value.json.return_value = {'success': True}
+
     convo = ai_pitmaster.ClaudeBBQConversation(
         api_key="test-key",
         target_pit=225,
@@ -535,8 +598,8 @@ def test_send_sms_no_phone():
     assert result is None  # Function returns None when no phone is provided
 
 
-@patch('requests.post')
-def test_send_sms_cooldown_expired_across_day_boundary(mock_post):
+@patch('requests.Session')
+def test_send_sms_cooldown_expired_across_day_boundary(mock_session_cls):
     """Regression: cooldown check must use total_seconds(), not .seconds.
 
     timedelta.seconds only returns the seconds-component (0..86399), so a
@@ -545,9 +608,8 @@ def test_send_sms_cooldown_expired_across_day_boundary(mock_post):
     alerts during cooks that span a full day (or sessions restored the next
     day). Once fixed, an SMS sent >24h ago must NOT block a new one.
     """
-    mock_response = Mock()
-    mock_response.json.return_value = {'success': True}
-    mock_post.return_value = mock_response
+    mock_post = mock_session_cls.return_value.post
+    mock_post.return_value.json.return_value = {'success': True}
 
     convo = ai_pitmaster.ClaudeBBQConversation(
         api_key="test-key",
@@ -573,12 +635,11 @@ def test_send_sms_cooldown_expired_across_day_boundary(mock_post):
     )
 
 
-@patch('requests.post')
-def test_send_sms_cooldown_still_active_within_window(mock_post):
+@patch('requests.Session')
+def test_send_sms_cooldown_still_active_within_window(mock_session_cls):
     """Cooldown must still block an SMS sent recently within the window."""
-    mock_response = Mock()
-    mock_response.json.return_value = {'success': True}
-    mock_post.return_value = mock_response
+    mock_post = mock_session_cls.return_value.post
+    mock_post.return_value.json.return_value = {'success': True}
 
     convo = ai_pitmaster.ClaudeBBQConversation(
         api_key="test-key",
@@ -619,6 +680,13 @@ def test_pitmaster_wisdom_content():
     assert "275°F" in ai_pitmaster.PITMASTER_WISDOM # Higher temp mention
 
 
+def test_pitmaster_wisdom_meets_prompt_cache_minimum():
+    """The cached system block must stay above Anthropic's 1024-token
+    minimum cacheable prefix (Sonnet), or cache_control is a silent no-op.
+    Uses the same ~4 chars/token estimate as _estimate_tokens, with margin."""
+    assert len(ai_pitmaster.PITMASTER_WISDOM) // 4 >= 1200
+
+
 def test_save_session(tmp_path):
     """Test session saving functionality"""
     session_file = tmp_path / "test_session.json"
@@ -847,6 +915,40 @@ def test_save_session_is_atomic(tmp_path, monkeypatch):
     assert any(m.get("content") == "would-be-corrupted" for m in data["messages"])
 
 
+def test_fuel_mentions_classified_once_with_word_boundaries():
+    """handle_user_input classifies fuel talk with the compiled FUEL_RE at
+    insertion time, so the proactive checks just read the stored flag.
+    Word boundaries also stop substring false positives the old keyword
+    list had ('add' used to match words like 'addled')."""
+    convo = ai_pitmaster.ClaudeBBQConversation(
+        api_key="test-key",
+        target_pit=225,
+        target_meat=203,
+        meat_type="brisket",
+        weight=12
+    )
+    convo.save_session = Mock()  # don't touch the working directory
+
+    convo.handle_user_input("just added a chimney of charcoal")
+    assert convo.recent_user_actions[-1]['has_fuel'] is True
+    assert convo.last_fuel_mention is not None
+    assert convo.temp_recovery_in_progress is True
+
+    # Inflected forms must classify as fuel too -- the old substring scan
+    # caught these and the boundaries shouldn't regress them.
+    for phrase in ("put more coals on", "adding some briquettes",
+                   "threw on woodchips", "refueled the firebox"):
+        convo.handle_user_input(phrase)
+        assert convo.recent_user_actions[-1]['has_fuel'] is True, phrase
+
+    convo.last_fuel_mention = None
+    convo.temp_recovery_in_progress = False
+    convo.handle_user_input("the dog looks addled by the smoke")
+    assert convo.recent_user_actions[-1]['has_fuel'] is False
+    assert convo.last_fuel_mention is None
+    assert convo.temp_recovery_in_progress is False
+
+
 def test_session_context_tracking():
     """Test that context tracking (recent actions, fuel mentions) is saved/restored"""
     import tempfile
@@ -1123,6 +1225,42 @@ def test_summarize_old_messages_triggered():
     assert convo.messages[1]['role'] == 'user'
 
 
+def test_build_request_messages_respects_token_budget():
+    """The per-call prompt must keep the initial cook-context message plus
+    the newest messages that fit the token budget, without mutating the
+    stored history. The newest message is always sent even if it alone
+    exceeds the budget."""
+    convo = ai_pitmaster.ClaudeBBQConversation(
+        api_key="test-key",
+        target_pit=225,
+        target_meat=203,
+        meat_type="brisket",
+        weight=12
+    )
+    convo.prompt_token_budget = 500
+
+    # Each message is ~100 tokens; only a handful fit next to the initial.
+    for i in range(20):
+        convo.messages.append({
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"msg{i:02d} " + "x" * 400
+        })
+    stored_before = list(convo.messages)
+
+    request = convo._build_request_messages()
+
+    assert request[0] == convo.messages[0]
+    assert request[-1] == convo.messages[-1]
+    assert len(request) < len(convo.messages)
+    assert convo._estimate_tokens(request) <= 500 + 100  # budget + slack for initial
+    assert convo.messages == stored_before  # history untouched
+
+    # A single oversized newest message must still go through.
+    convo.messages.append({"role": "user", "content": "y" * 10000})
+    request = convo._build_request_messages()
+    assert request[-1] == convo.messages[-1]
+
+
 def test_summarize_respects_minimum_messages():
     """Test that summarization requires >50 messages"""
     convo = ai_pitmaster.ClaudeBBQConversation(
@@ -1158,6 +1296,9 @@ def test_summarize_respects_minimum_messages():
 def _run_temp_reader_with_lines(lines):
     """Drive temp_reader_thread synchronously with a fixed list of stdout lines.
 
+    Lines are given as str for readability; they're encoded to bytes here
+    because the reader consumes the rtl_433 pipe in binary mode.
+
     Returns (convo, drained_queue_items).
     """
     convo = ai_pitmaster.ClaudeBBQConversation(
@@ -1169,7 +1310,7 @@ def _run_temp_reader_with_lines(lines):
     )
 
     fake_proc = MagicMock()
-    fake_proc.stdout = iter(lines)
+    fake_proc.stdout = iter(line.encode() for line in lines)
 
     with patch("ai_pitmaster.subprocess.Popen", return_value=fake_proc):
         convo.temp_reader_thread()
@@ -1189,6 +1330,18 @@ def _valid_thermopro_line():
     }) + "\n"
 
 
+def test_parse_rtl433_time_matches_strptime():
+    """The sliced-out fast path must agree with strptime on the fixed
+    rtl_433 format and reject garbage with ValueError like strptime did."""
+    stamp = "2026-04-27 09:05:59"
+    assert ai_pitmaster._parse_rtl433_time(stamp) == \
+        datetime.strptime(stamp, '%Y-%m-%d %H:%M:%S')
+
+    for bad in ("not a real timestamp", "2026-04-27", ""):
+        with pytest.raises(ValueError):
+            ai_pitmaster._parse_rtl433_time(bad)
+
+
 def test_temp_reader_skips_thermopro_missing_temperature_1():
     bad = json.dumps({
         "model": "Thermopro-TP12",
@@ -1253,4 +1406,36 @@ def test_temp_reader_skips_lacrosse_missing_temperature():
 
 def test_temp_reader_still_handles_json_decode_error():
     _, items = _run_temp_reader_with_lines(["{not valid json\n", _valid_thermopro_line()])
-    assert len(items) == 1
\ No newline at end of file
+    assert len(items) == 1
+
+
+def test_temp_reader_prefilters_unrelated_devices_without_json_parse():
+    """Lines from unrelated 433 MHz devices must be dropped by the cheap
+    substring prefilter before json.loads, while the unknown hardware is
+    still surfaced via _log_unknown_model for discoverability."""
+    noise = json.dumps({
+        "model": "Acurite-606TX",
+        "time": "2026-04-27 12:00:00",
+        "temperature_C": 21.0,
+    }) + "\n"
+
+    convo = ai_pitmaster.ClaudeBBQConversation(
+        api_key="test-key",
+        target_pit=225,
+        target_meat=203,
+        meat_type="brisket",
+        weight=12,
+    )
+    convo._log_unknown_model = Mock()
+
+    fake_proc = MagicMock()
+    fake_proc.stdout = iter([noise.encode(), _valid_thermopro_line().encode()])
+
+    with patch("ai_pitmaster.subprocess.Popen", return_value=fake_proc), \
+         patch("ai_pitmaster.json.loads", wraps=json.loads) as mock_loads:
+        convo.temp_reader_thread()
+
+    # Only the Thermopro line should have been parsed.
+    assert mock_loads.call_count == 1
+    convo._log_unknown_model.assert_called_once_with("Acurite-606TX")
+    assert convo.data_queue.qsize() == 1
\ No newline at end of file